@@ -9,10 +9,30 @@ Generates transaction sequences with configurable parameters:
 """
 
 import argparse
-import csv
+import array
 import random
 import math
-from typing import List, Tuple, Optional
+import multiprocessing
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+# Shards larger than this use _ZipfRejection instead of an alias table
+ZIPF_TABLE_MAX_KEYS = 1 << 20
+# Key spaces up to this size get a flat key -> shard lookup table
+KEY_TO_SHARD_MAX_KEYS = 10_000_000
+
+# Transactions sampled per _sample_batch call (and per write() in to_csv)
+BATCH_ROWS = 8192
+# Transactions per independently seeded task (the unit of work for --jobs)
+JOB_TASK_ROWS = 16 * BATCH_ROWS
+
+# Transaction kinds in BenchmarkGenerator._sample_batch output
+TX_RO = 0
+TX_INTRA = 1
+TX_CROSS = 2
 
 
 def generate_shard_map(num_clusters: int, total_keys: int) -> dict:
@@ -35,9 +55,95 @@ def all_nodes_str(nodes: list) -> str:
     return "[" + ", ".join(nodes) + "]"
 
 
+def _csv_cell(value) -> str:
+    """Quote a cell the way csv.writer's default (QUOTE_MINIMAL) dialect does."""
+    text = str(value)
+    if any(c in text for c in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _format_tx(kind: int, src: int, dst: int, amt: int) -> str:
+    """Format a transaction without spaces, e.g. (1,2,3) or (7,) for read-only."""
+    if kind == TX_RO:
+        return f"({src},)"
+    return f"({src},{dst},{amt})"
+
+
+def _build_alias(weights: Sequence[float]) -> Tuple[array.array, array.array]:
+    """Build Walker/Vose alias tables for O(1) sampling from normalized weights."""
+    n = len(weights)
+    prob = array.array("d", (w * n for w in weights))
+    alias = array.array("i", range(n))
+    small = [i for i in range(n) if prob[i] < 1.0]
+    large = [i for i in range(n) if prob[i] >= 1.0]
+    while small and large:
+        s_idx = small.pop()
+        l_idx = large.pop()
+        alias[s_idx] = l_idx
+        prob[l_idx] -= 1.0 - prob[s_idx]
+        if prob[l_idx] < 1.0:
+            small.append(l_idx)
+        else:
+            large.append(l_idx)
+    # Leftovers are 1.0 up to float rounding
+    for i in small + large:
+        prob[i] = 1.0
+    return prob, alias
+
+
+class _ZipfRejection:
+    """
+    Zipfian sampler over offsets [0, n) with O(1) state.
+
+    Rejection-inversion (Hoermann & Derflinger, 1996): valid for any
+    exponent > 0 and bounded n, with an expected O(1) draws per sample.
+    """
+
+    def __init__(self, n: int, alpha: float):
+        self.n = n
+        self.alpha = alpha
+        self._h_x1 = self._h_integral(1.5) - 1.0
+        self._h_n = self._h_integral(n + 0.5)
+        self._s = 2.0 - self._h_integral_inverse(self._h_integral(2.5) - self._h(2.0))
+
+    def sample(self, rand: Callable[[], float]) -> int:
+        while True:
+            u = self._h_n + rand() * (self._h_x1 - self._h_n)
+            x = self._h_integral_inverse(u)
+            k = min(max(int(x + 0.5), 1), self.n)
+            if k - x <= self._s or u >= self._h_integral(k + 0.5) - self._h(k):
+                return k - 1
+
+    def _h(self, x: float) -> float:
+        return math.exp(-self.alpha * math.log(x))
+
+    def _h_integral(self, x: float) -> float:
+        log_x = math.log(x)
+        return _expm1_over_x((1.0 - self.alpha) * log_x) * log_x
+
+    def _h_integral_inverse(self, x: float) -> float:
+        t = max(x * (1.0 - self.alpha), -1.0)
+        return math.exp(_log1p_over_x(t) * x)
+
+
+def _log1p_over_x(x: float) -> float:
+    if abs(x) > 1e-8:
+        return math.log1p(x) / x
+    return 1.0 - x * (0.5 - x * (1.0 / 3.0 - 0.25 * x))
+
+
+def _expm1_over_x(x: float) -> float:
+    if abs(x) > 1e-8:
+        return math.expm1(x) / x
+    return 1.0 + x * 0.5 * (1.0 + x / 3.0 * (1.0 + 0.25 * x))
+
+
 class BenchmarkGenerator:
     """Generate transaction workloads for testing."""
 
+    CSV_HEADER = ("Set Number", "Transactions", "Live Nodes")
+
     def __init__(
         self,
         ro_percent: float = 0.0,
@@ -67,113 +173,346 @@ class BenchmarkGenerator:
         self.nodes_per_cluster = nodes_per_cluster
         self.total_keys = total_keys
         self.shards = generate_shard_map(num_clusters, total_keys)
+        # Intra-shard transfers need a destination distinct from the source
+        if self.ro_percent < 1 and self.cross_shard_percent < 1:
+            small = [sid for sid, (lo, hi) in self.shards.items() if hi - lo + 1 < 2]
+            if small:
+                raise ValueError(
+                    f"Shards {small} have fewer than 2 keys; intra-shard transfers need "
+                    f"at least 2 keys per shard (total_keys={total_keys}, "
+                    f"num_clusters={num_clusters})"
+                )
         self.nodes = generate_nodes(num_clusters, nodes_per_cluster)
+        self._all_nodes_cell = all_nodes_str(self.nodes)
+        self._shard_ids = tuple(self.shards.keys())
+        self._other_shards = {
+            sid: tuple(s for s in self._shard_ids if s != sid) for sid in self._shard_ids
+        }
+        self._shard_his = tuple(hi for _, hi in self.shards.values())
+        # Built on first _get_shard_configured call (see _build_key_to_shard)
+        self._key_to_shard = None
+
+        # Private RNG: seeding does not touch the global random state
+        self._rng = random.Random(seed)
+
+        # Precompute Zipfian alias tables for each shard; shards too large
+        # to tabulate get a constant-memory rejection sampler instead.
+        # Tables depend only on the shard size, so equal-sized shards (the
+        # usual even partition) share one set. Skew <= 0 is plain uniform
+        # and needs no tables at all.
+        self._uniform = skew <= 0
+        self._alias = {}
+        self._zipf_cum = {}
+        self._zipf_samplers = {}
+        if not self._uniform:
+            zipf_by_n = {}
+            for shard_id, (lo, hi) in self.shards.items():
+                n = hi - lo + 1
+                if n not in zipf_by_n:
+                    zipf_by_n[n] = self._build_zipf(n, skew)
+                sampler, alias, cum = zipf_by_n[n]
+                if sampler is not None:
+                    self._zipf_samplers[shard_id] = sampler
+                else:
+                    self._alias[shard_id] = alias
+                    # The CDF serves _sample_key_excluding's conditional draws
+                    self._zipf_cum[shard_id] = cum
 
-        if seed is not None:
-            random.seed(seed)
+    @staticmethod
+    def _build_zipf(n: int, skew: float):
+        """Return (sampler, alias, cum) for a shard of n keys; sampler is None when tabulated."""
+        if n > ZIPF_TABLE_MAX_KEYS:
+            return _ZipfRejection(n, skew), None, None
+        if skew > 0:
+            weights = array.array("d", (math.pow(i, -skew) for i in range(1, n + 1)))
+        else:
+            weights = array.array("d", [1.0]) * n
+        inv = 1.0 / math.fsum(weights)
+        # Normalize in place and build the CDF in the same pass
+        cum = array.array("d", weights)
+        running = 0.0
+        for i in range(n):
+            w = weights[i] * inv
+            weights[i] = w
+            running += w
+            cum[i] = running
+        return None, _build_alias(weights), cum
+
+    def _sample_key(self, shard_id: int, rand: Callable[[], float]) -> int:
+        """Sample a key from the given shard using Zipfian distribution."""
+        if self._uniform:
+            lo, hi = self.shards[shard_id]
+            return lo + int(rand() * (hi - lo + 1))
+        sampler = self._zipf_samplers.get(shard_id)
+        if sampler is not None:
+            return self.shards[shard_id][0] + sampler.sample(rand)
+        prob, alias = self._alias[shard_id]
+        # One uniform draw picks the column (integer part) and the coin (fraction)
+        u = rand() * len(prob)
+        i = int(u)
+        return self.shards[shard_id][0] + (i if u - i < prob[i] else alias[i])
+
+    def _sample_key_excluding(
+        self, shard_id: int, exclude: int, rand: Callable[[], float]
+    ) -> int:
+        """Sample a key from the shard's Zipfian distribution conditioned on key != exclude."""
+        lo, hi = self.shards[shard_id]
+        if self._uniform:
+            # Uniform over the other n - 1 keys: skip over the excluded offset
+            offset = int(rand() * (hi - lo))
+            return lo + offset + (offset >= exclude - lo)
+        cum = self._zipf_cum.get(shard_id)
+        if cum is None:
+            # Rejection-sampled shard: no table to condition on, but a repeat
+            # needs the excluded key to be drawn again, so retries stay O(1).
+            key = self._sample_key(shard_id, rand)
+            while key == exclude:
+                key = self._sample_key(shard_id, rand)
+            return key
+        # Draw from the CDF with the excluded key's mass cut out: u covers
+        # the remaining mass and skips over the excluded interval.
+        n = len(cum)
+        x = exclude - lo
+        lo_cum = cum[x - 1] if x else 0.0
+        p = cum[x] - lo_cum
+        u = rand() * (cum[-1] - p)
+        if u < lo_cum or x == n - 1:
+            return lo + bisect_right(cum, u, 0, x - 1)
+        return lo + bisect_right(cum, u + p, x + 1, n - 1)
+
+    def _sample_batch(
+        self, n_tx: int, rng: random.Random
+    ) -> Tuple[List[int], List[int], List[int], List[int]]:
+        """
+        Draw n_tx transactions into parallel lists (kinds, srcs, dsts, amts).
 
-        # Precompute Zipfian weights for each shard
-        self._zipf_weights = {}
-        for shard_id, (lo, hi) in self.shards.items():
-            n = hi - lo + 1
-            if skew > 0:
-                weights = [1.0 / ((i + 1) ** skew) for i in range(n)]
+        Read-only slots have dst = 0 and amt = 0. This is the generator's hot
+        loop: all state is bound to locals, shard picks index the cached
+        tuples directly, and uniform and alias-table draws are inlined.
+        """
+        rand = rng.random
+        ro_p = self.ro_percent
+        cross_p = self.cross_shard_percent
+        shard_ids = self._shard_ids
+        num_shards = len(shard_ids)
+        other_shards = self._other_shards
+        sample = self._sample_key
+        sample_excluding = self._sample_key_excluding
+        # (lo, prob, alias, n) per inlinable shard, with prob None for
+        # uniform; None for rejection-sampled shards (-> _sample_key)
+        tables = {}
+        for sid, (lo, hi) in self.shards.items():
+            if self._uniform:
+                tables[sid] = (lo, None, None, hi - lo + 1)
+            elif sid in self._alias:
+                prob, alias = self._alias[sid]
+                tables[sid] = (lo, prob, alias, len(prob))
             else:
-                weights = [1.0] * n
-            total = sum(weights)
-            self._zipf_weights[shard_id] = [w / total for w in weights]
+                tables[sid] = None
+
+        kinds = [TX_RO] * n_tx
+        srcs = [0] * n_tx
+        dsts = [0] * n_tx
+        # Transfer amounts are independent of everything else; draw them in one call
+        amts = rng.choices(range(1, 6), k=n_tx)
+
+        for i in range(n_tx):
+            src_shard = shard_ids[int(rand() * num_shards)]
+            # Decide read-only vs read-write, then intra-shard vs cross-shard
+            if rand() < ro_p:
+                kind = TX_RO
+                amts[i] = 0
+            elif rand() < cross_p:
+                kind = TX_CROSS
+                others = other_shards[src_shard]
+                dst_shard = others[int(rand() * len(others))]
+            else:
+                kind = TX_INTRA
 
-    def _sample_key(self, shard_id: int) -> int:
-        """Sample a key from the given shard using Zipfian distribution."""
-        lo, hi = self.shards[shard_id]
-        n = hi - lo + 1
-        offset = random.choices(range(n), weights=self._zipf_weights[shard_id], k=1)[0]
-        return lo + offset
-
-    def _generate_ro_tx(self) -> Tuple[int]:
-        """Generate a read-only (balance query) transaction."""
-        shard_id = random.choice(list(self.shards.keys()))
-        key = self._sample_key(shard_id)
-        return (key,)
-
-    def _generate_rw_intra_tx(self) -> Tuple[int, int, int]:
-        """Generate a read-write intra-shard transaction."""
-        shard_id = random.choice(list(self.shards.keys()))
-        src = self._sample_key(shard_id)
-        dst = self._sample_key(shard_id)
-        # Ensure src != dst
-        while dst == src:
-            dst = self._sample_key(shard_id)
-        amt = random.randint(1, 5)
-        return (src, dst, amt)
-
-    def _generate_rw_cross_tx(self) -> Tuple[int, int, int]:
-        """Generate a read-write cross-shard transaction."""
-        shards = list(self.shards.keys())
-        src_shard = random.choice(shards)
-        dst_shard = random.choice([s for s in shards if s != src_shard])
-        src = self._sample_key(src_shard)
-        dst = self._sample_key(dst_shard)
-        amt = random.randint(1, 5)
-        return (src, dst, amt)
+            t = tables[src_shard]
+            if t is None:
+                src = sample(src_shard, rand)
+            else:
+                lo, prob, alias, n = t
+                u = rand() * n
+                j = int(u)
+                src = lo + (j if prob is None or u - j < prob[j] else alias[j])
+            srcs[i] = src
+
+            if kind == TX_INTRA:
+                kinds[i] = TX_INTRA
+                dsts[i] = sample_excluding(src_shard, src, rand)
+            elif kind == TX_CROSS:
+                kinds[i] = TX_CROSS
+                t = tables[dst_shard]
+                if t is None:
+                    dsts[i] = sample(dst_shard, rand)
+                else:
+                    lo, prob, alias, n = t
+                    u = rand() * n
+                    j = int(u)
+                    dsts[i] = lo + (j if prob is None or u - j < prob[j] else alias[j])
+
+        return kinds, srcs, dsts, amts
+
+    def _draw_tasks(self) -> List[Tuple[int, int]]:
+        """
+        Split the workload into (seed, count) tasks of up to JOB_TASK_ROWS.
+
+        Task seeds come from the generator's RNG and each task samples from
+        its own Random, so every consumer (generate, to_csv with any jobs)
+        sees the same workload for a given seed.
+        """
+        return [
+            (self._rng.getrandbits(64), min(JOB_TASK_ROWS, self.num_transactions - start))
+            for start in range(0, self.num_transactions, JOB_TASK_ROWS)
+        ]
+
+    def _iter_task_batches(
+        self, seed: int, count: int
+    ) -> Iterator[Tuple[List[int], List[int], List[int], List[int]]]:
+        """Yield one task's transactions as _sample_batch results of up to BATCH_ROWS."""
+        rng = random.Random(seed)
+        for start in range(0, count, BATCH_ROWS):
+            yield self._sample_batch(min(BATCH_ROWS, count - start), rng)
+
+    def _iter_batches(
+        self, tasks: Optional[List[Tuple[int, int]]] = None
+    ) -> Iterator[Tuple[List[int], List[int], List[int], List[int]]]:
+        """Yield the whole workload (tasks drawn if not given) as successive batches."""
+        for seed, count in self._draw_tasks() if tasks is None else tasks:
+            yield from self._iter_task_batches(seed, count)
+
+    def iter_transactions(self) -> Iterator[Tuple]:
+        """Lazily generate transactions; memory stays bounded by one batch."""
+        for kinds, srcs, dsts, amts in self._iter_batches():
+            for kind, src, dst, amt in zip(kinds, srcs, dsts, amts):
+                yield (src,) if kind == TX_RO else (src, dst, amt)
+
+    def generate_arrays(self) -> Dict[str, array.array]:
+        """
+        Generate the workload as packed parallel arrays.
+
+        Returns {'kind', 'src', 'dst', 'amt'}; kind is TX_RO/TX_INTRA/TX_CROSS,
+        and read-only entries have dst == 0 and amt == 0.
+        """
+        key_type = "i" if self.total_keys < 2**31 else "q"
+        arrays = {
+            "kind": array.array("b"),
+            "src": array.array(key_type),
+            "dst": array.array(key_type),
+            "amt": array.array("b"),
+        }
+        for kinds, srcs, dsts, amts in self._iter_batches():
+            arrays["kind"].extend(kinds)
+            arrays["src"].extend(srcs)
+            arrays["dst"].extend(dsts)
+            arrays["amt"].extend(amts)
+        return arrays
 
     def generate(self) -> List[Tuple]:
         """Generate the transaction list based on parameters."""
-        transactions = []
+        return list(self.iter_transactions())
 
-        for _ in range(self.num_transactions):
-            # Decide read-only vs read-write
-            if random.random() < self.ro_percent:
-                tx = self._generate_ro_tx()
-            else:
-                # Decide intra-shard vs cross-shard
-                if random.random() < self.cross_shard_percent:
-                    tx = self._generate_rw_cross_tx()
-                else:
-                    tx = self._generate_rw_intra_tx()
-            transactions.append(tx)
+    def _iter_csv_chunks(
+        self,
+        batches: Iterator[Tuple[List[int], List[int], List[int], List[int]]],
+        first_cells: Optional[Tuple[str, str]] = None,
+    ) -> Iterator[Tuple[str, int, int, int, int]]:
+        """
+        Yield (rows, count, ro_count, intra_count, cross_count) per batch.
 
-        return transactions
+        Rows match csv.writer's default dialect: the transaction cell always
+        contains a comma and is quoted, lines end with \r\n. Set number and
+        live nodes are empty except on the very first row, which gets the
+        already-quoted first_cells (set number, live nodes) when given.
+        """
+        for kinds, srcs, dsts, amts in batches:
+            # The kernel already classified every row; no shard lookups needed
+            ro_count = kinds.count(TX_RO)
+            intra_count = kinds.count(TX_INTRA)
+            cross_count = kinds.count(TX_CROSS)
+            lines = [
+                f',"{_format_tx(kind, src, dst, amt)}",\r\n'
+                for kind, src, dst, amt in zip(kinds, srcs, dsts, amts)
+            ]
+            if first_cells is not None and lines:
+                set_cell, nodes_cell = first_cells
+                tx_str = _format_tx(kinds[0], srcs[0], dsts[0], amts[0])
+                lines[0] = f'{set_cell},"{tx_str}",{nodes_cell}\r\n'
+                first_cells = None
+            yield "".join(lines), len(lines), ro_count, intra_count, cross_count
+
+    def _csv_task(
+        self, seed: int, count: int, first_cells: Optional[Tuple[str, str]] = None
+    ) -> List[Tuple[str, int, int, int, int]]:
+        """Run one (seed, count) task and return its _iter_csv_chunks results."""
+        return list(self._iter_csv_chunks(self._iter_task_batches(seed, count), first_cells))
+
+    def _iter_task_chunks(
+        self, jobs: int, first_cells: Tuple[str, str]
+    ) -> Iterator[Tuple[str, int, int, int, int]]:
+        """
+        Yield (rows, count, ro_count, intra_count, cross_count) per batch.
 
-    def to_csv(self, filename: str, set_number: int = 1):
+        The workload is the same task stream _iter_batches produces, so the
+        output for a given seed is identical for any jobs value. With more
+        than one task and jobs > 1, tasks run on a pool of at most
+        min(jobs, tasks) workers, with at most two tasks per worker in flight
+        so results cannot pile up when writing is slower than generating.
+        """
+        tasks = self._draw_tasks()
+        workers = min(jobs, len(tasks))
+        if workers <= 1:
+            yield from self._iter_csv_chunks(self._iter_batches(tasks), first_cells)
+            return
+        # Only the first task writes the set number and live nodes
+        task_args = [
+            (seed, count, first_cells if i == 0 else None)
+            for i, (seed, count) in enumerate(tasks)
+        ]
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(self,)) as pool:
+            task_iter = iter(task_args)
+            pending = deque(
+                pool.apply_async(_csv_chunk_task, (task,))
+                for task in islice(task_iter, 2 * workers)
+            )
+            while pending:
+                chunks = pending.popleft().get()
+                for task in islice(task_iter, 1):
+                    pending.append(pool.apply_async(_csv_chunk_task, (task,)))
+                yield from chunks
+
+    def to_csv(self, filename: str, set_number: int = 1, jobs: int = 1):
         """Write transactions to CSV file in test format."""
-        transactions = self.generate()
+        count = 0
+        ro_count = 0
+        intra_count = 0
+        cross_count = 0
 
-        with open(filename, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["Set Number", "Transactions", "Live Nodes"])
+        first_cells = (_csv_cell(set_number), _csv_cell(self._all_nodes_cell))
 
-            for i, tx in enumerate(transactions):
-                tx_str = str(tx).replace(" ", "")
-                if i == 0:
-                    writer.writerow([set_number, tx_str, all_nodes_str(self.nodes)])
-                else:
-                    writer.writerow(["", tx_str, ""])
+        # Chunks are written as they are produced, with stats summed inline
+        with open(filename, "w", buffering=1 << 20, newline="") as f:
+            f.write(",".join(map(_csv_cell, self.CSV_HEADER)) + "\r\n")
+            for rows, n, ro, intra, cross in self._iter_task_chunks(jobs, first_cells):
+                f.write(rows)
+                count += n
+                ro_count += ro
+                intra_count += intra
+                cross_count += cross
 
-        print(f"Generated {len(transactions)} transactions to {filename}")
-        self._print_stats(transactions)
+        print(f"Generated {count} transactions to {filename}")
+        self._print_stats(count, ro_count, intra_count, cross_count)
 
-    def _print_stats(self, transactions: List[Tuple]):
+    def _print_stats(self, total: int, ro_count: int, intra_count: int, cross_count: int):
         """Print statistics about the generated workload."""
-        ro_count = sum(1 for tx in transactions if len(tx) == 1)
-        rw_count = len(transactions) - ro_count
-
-        cross_count = 0
-        intra_count = 0
-        for tx in transactions:
-            if len(tx) == 3:
-                src, dst, _ = tx
-                src_shard = self._get_shard_configured(src)
-                dst_shard = self._get_shard_configured(dst)
-                if src_shard != dst_shard:
-                    cross_count += 1
-                else:
-                    intra_count += 1
+        rw_count = total - ro_count
 
         print(f"\n=== Workload Statistics ===")
-        print(f"Total transactions: {len(transactions)}")
-        print(f"Read-only: {ro_count} ({100*ro_count/len(transactions):.1f}%)")
-        print(f"Read-write: {rw_count} ({100*rw_count/len(transactions):.1f}%)")
+        print(f"Total transactions: {total}")
+        print(f"Read-only: {ro_count} ({100*ro_count/total:.1f}%)")
+        print(f"Read-write: {rw_count} ({100*rw_count/total:.1f}%)")
         if rw_count > 0:
             print(f"  Intra-shard: {intra_count} ({100*intra_count/rw_count:.1f}% of RW)")
             print(f"  Cross-shard: {cross_count} ({100*cross_count/rw_count:.1f}% of RW)")
@@ -185,11 +524,38 @@ class BenchmarkGenerator:
         # Default assumes 3 shards; for configured runs we use the generator's shard map instead.
         raise RuntimeError("Use BenchmarkGenerator._get_shard_configured()")
 
-    def _get_shard_configured(self, key: int) -> int:
+    def _build_key_to_shard(self) -> array.array:
+        # Shard ranges are contiguous from key 1, so the lookup table is the
+        # concatenation of per-shard runs (index 0 is unused and maps to 1).
+        typecode = "B" if self.num_clusters < 256 else "H"
+        table = array.array(typecode, [1])
         for sid, (lo, hi) in self.shards.items():
-            if lo <= key <= hi:
-                return sid
-        return 1
+            table.extend(array.array(typecode, [sid]) * (hi - lo + 1))
+        return table
+
+    def _get_shard_configured(self, key: int) -> int:
+        table = self._key_to_shard
+        if table is None and self.total_keys <= KEY_TO_SHARD_MAX_KEYS:
+            table = self._key_to_shard = self._build_key_to_shard()
+        if table is not None:
+            return table[key] if 0 <= key < len(table) else 1
+        i = bisect_left(self._shard_his, key)
+        return self._shard_ids[i] if i < len(self._shard_ids) else 1
+
+
+# Per-process generator for to_csv(jobs > 1), installed by the Pool initializer
+_worker_generator = None
+
+
+def _init_worker(generator: BenchmarkGenerator):
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _csv_chunk_task(
+    task: Tuple[int, int, Optional[Tuple[str, str]]]
+) -> List[Tuple[str, int, int, int, int]]:
+    return _worker_generator._csv_task(*task)
 
 
 def main():
@@ -257,6 +623,13 @@ def main():
         default=1,
         help="Set number in the output CSV",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for generation; output for a given --seed "
+        "is the same for any value (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -271,7 +644,7 @@ def main():
         seed=args.seed,
     )
 
-    generator.to_csv(args.output, set_number=args.set)
+    generator.to_csv(args.output, set_number=args.set, jobs=args.jobs)
 
 
 if __name__ == "__main__":